@@ -5,11 +5,22 @@ Runs daily at 6 AM ET via GitHub Actions
 """
 
 import os
+import re
 import json
+import orjson
+import time
+import asyncio
+import hashlib
+import itertools
 import feedparser
 import requests
+from collections import namedtuple
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
+from pydantic import BaseModel
 import firebase_admin
 from firebase_admin import credentials, firestore
 
@@ -17,7 +28,7 @@ from firebase_admin import credentials, firestore
 def init_firebase():
     if not firebase_admin._apps:
         # For GitHub Actions, use service account from secrets
-        service_account = json.loads(os.environ.get('FIREBASE_SERVICE_ACCOUNT', '{}'))
+        service_account = orjson.loads(os.environ.get('FIREBASE_SERVICE_ACCOUNT', '{}'))
         if service_account:
             cred = credentials.Certificate(service_account)
         else:
@@ -27,23 +38,69 @@ def init_firebase():
     return firestore.client()
 
 # Initialize OpenAI
-client = OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+client = AsyncOpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+
+# Cap concurrent OpenAI requests so gathered batches stay under rate limits
+SEM = asyncio.Semaphore(20)
+
+# Opt-in: run article processing through the OpenAI Batch API (50% cost,
+# no latency SLA per response). The run polls until the batch finishes or
+# the deadline passes, then falls back to live calls for anything missing.
+USE_OPENAI_BATCH = os.environ.get('OPENAI_USE_BATCH') == '1'
+BATCH_POLL_SECONDS = 30
+BATCH_DEADLINE_SECONDS = int(os.environ.get('OPENAI_BATCH_DEADLINE', '1800'))
+
+
+async def _with_backoff(method, **kwargs):
+    """Call an OpenAI method under the concurrency cap, backing off on rate limits"""
+    delay = 1
+    for attempt in range(5):
+        try:
+            async with SEM:
+                return await method(**kwargs)
+        except RateLimitError:
+            if attempt == 4:
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2
+
+
+async def _chat_completion(**kwargs):
+    """Chat completion with the shared concurrency cap and backoff"""
+    return await _with_backoff(client.chat.completions.create, **kwargs)
+
+
+async def _chat_parse(**kwargs):
+    """Like _chat_completion, but for schema-enforced structured outputs
+
+    response_format is a pydantic model; the API guarantees the reply
+    decodes into it, so callers read .parsed instead of json-parsing.
+    """
+    return await _with_backoff(client.beta.chat.completions.parse, **kwargs)
+
+# Shared HTTP session for feed fetches: pooled connections reuse TCP/TLS
+# handshakes across feeds on the same CDN, and servers get a real UA
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+session.headers["User-Agent"] = "Chole/1.0"
 
 # RSS Feed Sources for Mining News
+Feed = namedtuple("Feed", "url name")
+
 RSS_FEEDS = [
     # Major Mining News
-    {"url": "https://www.mining.com/feed/", "name": "Mining.com"},
-    {"url": "https://www.kitco.com/news/rss/mining.rss", "name": "Kitco Mining"},
-    {"url": "https://www.reuters.com/news/archive/miningNews?view=rss", "name": "Reuters Mining"},
-    {"url": "https://www.bloomberg.com/feeds/bpol/sitemap_news.xml", "name": "Bloomberg"},
-    
+    Feed("https://www.mining.com/feed/", "Mining.com"),
+    Feed("https://www.kitco.com/news/rss/mining.rss", "Kitco Mining"),
+    Feed("https://www.reuters.com/news/archive/miningNews?view=rss", "Reuters Mining"),
+    Feed("https://www.bloomberg.com/feeds/bpol/sitemap_news.xml", "Bloomberg"),
+
     # Junior Mining
-    {"url": "https://ceo.ca/api/sedi/rss", "name": "CEO.CA"},
-    {"url": "https://www.juniorminingnetwork.com/feed", "name": "Junior Mining Network"},
-    
+    Feed("https://ceo.ca/api/sedi/rss", "CEO.CA"),
+    Feed("https://www.juniorminingnetwork.com/feed", "Junior Mining Network"),
+
     # Commodity Specific
-    {"url": "https://www.gold.org/feed/rss.xml", "name": "World Gold Council"},
-    {"url": "https://www.silverinstitute.org/feed/", "name": "Silver Institute"},
+    Feed("https://www.gold.org/feed/rss.xml", "World Gold Council"),
+    Feed("https://www.silverinstitute.org/feed/", "Silver Institute"),
 ]
 
 # Keywords for commodity filtering
@@ -66,93 +123,209 @@ REGION_KEYWORDS = {
     "africa": ["africa", "african", "congo", "drc", "south africa", "mali", "ghana", "tanzania", "zambia", "namibia"]
 }
 
+# Junior mining keywords
+JUNIOR_KEYWORDS = ["junior", "explorer", "tsx-v", "tsxv", "cse", "asx", "small cap", "drill result"]
+
+# Article category keywords, checked in order - first match wins
+CATEGORY_KEYWORDS = [
+    ("Drill Results", ["drill", "intercept", "assay", "metres", "meters", "grade"]),
+    ("M&A", ["acquire", "merger", "takeover", "bid", "deal", "m&a"]),
+    ("Markets", ["price", "spot", "futures", "trading", "market"]),
+    ("Production", ["production", "output", "guidance", "quarterly"]),
+    ("Policy", ["policy", "regulation", "government", "permit", "approval"]),
+    ("Exploration", ["exploration", "discovery", "target", "prospective"]),
+]
 
-def fetch_all_feeds():
-    """Fetch articles from all RSS feeds"""
-    all_articles = []
-    
-    for feed_info in RSS_FEEDS:
-        try:
-            feed = feedparser.parse(feed_info["url"])
-            for entry in feed.entries[:20]:  # Limit per feed
-                # Parse date
-                published = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    published = datetime(*entry.updated_parsed[:6])
-                else:
-                    published = datetime.now()
-                
-                # Only include articles from last 24 hours
-                if datetime.now() - published > timedelta(hours=36):
+
+def _compile_keywords(keywords):
+    """Compile a keyword list into one alternation regex for a single C-level scan"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Compile every keyword set once at import so each article needs one
+# regex scan per set instead of a Python-level loop over keywords
+COMMODITY_PATTERNS = {c: _compile_keywords(kws) for c, kws in COMMODITY_KEYWORDS.items()}
+REGION_PATTERNS = {r: _compile_keywords(kws) for r, kws in REGION_KEYWORDS.items()}
+JUNIOR_PATTERN = _compile_keywords(JUNIOR_KEYWORDS)
+CATEGORY_PATTERNS = [(cat, _compile_keywords(kws)) for cat, kws in CATEGORY_KEYWORDS]
+
+
+def load_feed_cache(db):
+    """Load the per-feed ETag/Last-Modified cache from Firestore"""
+    if db is None:
+        return {}
+    try:
+        doc = db.collection("system").document("feed_cache").get()
+        if doc.exists:
+            return doc.to_dict().get("feeds", {})
+    except Exception as e:
+        print(f"Feed cache load error: {e}")
+    return {}
+
+
+def save_feed_cache(db, cache):
+    """Persist the per-feed ETag/Last-Modified cache to Firestore"""
+    if db is None:
+        return
+    try:
+        db.collection("system").document("feed_cache").set({
+            "feeds": cache,
+            "updatedAt": firestore.SERVER_TIMESTAMP
+        })
+    except Exception as e:
+        print(f"Feed cache save error: {e}")
+
+
+def _fetch_one(feed_info, cache_entry):
+    """Fetch and filter articles from a single RSS feed
+
+    Returns (articles, cache_entry) where cache_entry carries the feed's
+    ETag/Last-Modified validators for the next run's conditional GET.
+    """
+    articles = []
+
+    # One snapshot per feed instead of two datetime.now() calls per entry
+    now = datetime.now()
+    cutoff_ts = (now - timedelta(hours=36)).timestamp()
+
+    try:
+        headers = {}
+        if cache_entry.get("etag"):
+            headers["If-None-Match"] = cache_entry["etag"]
+        if cache_entry.get("modified"):
+            headers["If-Modified-Since"] = cache_entry["modified"]
+
+        response = session.get(feed_info.url, headers=headers, timeout=30)
+
+        # 304 Not Modified - nothing new since last run, skip the parse
+        if response.status_code == 304:
+            print(f"Unchanged: {feed_info.name}")
+            return articles, cache_entry
+
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["modified"] = response.headers["Last-Modified"]
+
+        feed = feedparser.parse(response.content)
+
+        for entry in feed.entries[:20]:  # Limit per feed
+            # Parse date
+            parsed = None
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                parsed = entry.published_parsed
+            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+                parsed = entry.updated_parsed
+
+            if parsed is not None:
+                # Only include articles from the last 36 hours; compare
+                # raw time tuples so stale entries never build a datetime
+                if time.mktime(parsed) < cutoff_ts:
                     continue
-                
-                article = {
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "summary": entry.get("summary", entry.get("description", ""))[:500],
-                    "source": feed_info["name"],
-                    "published": published.isoformat(),
-                    "image": extract_image(entry)
-                }
-                all_articles.append(article)
-        except Exception as e:
-            print(f"Error fetching {feed_info['name']}: {e}")
-    
-    return all_articles
+                published = datetime(*parsed[:6])
+            else:
+                published = now
+
+            # Feed summaries arrive as HTML; strip to plain text so we
+            # don't store markup or pay LLM tokens for tags. The parsed
+            # tree is reused for image extraction.
+            summary_html = entry.get("summary", entry.get("description", ""))
+            summary_tree = HTMLParser(summary_html) if summary_html else None
+            summary_text = summary_tree.text(separator=' ').strip()[:500] if summary_tree else ""
+
+            article = {
+                "title": entry.get("title", ""),
+                "link": entry.get("link", ""),
+                "summary": summary_text,
+                "source": feed_info.name,
+                "published": published.isoformat(),
+                "image": extract_image(entry, summary_tree)
+            }
+            # Lowercase once here; every filter and the categorizer scan
+            # this field instead of rebuilding it per pass
+            article["_search_text"] = (article["title"] + " " + article["summary"]).lower()
+            articles.append(article)
+
+        # Only adopt the new validators once every entry was ingested;
+        # a partial failure must not 304-skip the missed entries next run
+        cache_entry = validators
+    except Exception as e:
+        print(f"Error fetching {feed_info.name}: {e}")
+
+    return articles, cache_entry
+
+
+def fetch_all_feeds(db=None):
+    """Fetch articles from all RSS feeds in parallel"""
+    # Conditional GETs let unchanged feeds answer with a bodyless 304,
+    # skipping both the download and the XML parse
+    cache = load_feed_cache(db)
 
+    # Feeds are I/O-bound, so fetch them concurrently instead of paying
+    # each feed's network latency in sequence
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+        results = list(executor.map(
+            lambda feed_info: _fetch_one(feed_info, cache.get(feed_info.url, {})),
+            RSS_FEEDS
+        ))
 
-def extract_image(entry):
+    save_feed_cache(db, {
+        feed_info.url: entry
+        for feed_info, (_, entry) in zip(RSS_FEEDS, results) if entry
+    })
+
+    return list(itertools.chain.from_iterable(articles for articles, _ in results))
+
+
+def extract_image(entry, summary_tree=None):
     """Extract image URL from feed entry"""
     # Try media:content
     if hasattr(entry, 'media_content') and entry.media_content:
         return entry.media_content[0].get('url', '')
-    
+
     # Try enclosures
     if hasattr(entry, 'enclosures') and entry.enclosures:
         for enc in entry.enclosures:
             if 'image' in enc.get('type', ''):
                 return enc.get('href', '')
-    
-    # Try to extract from summary/content
-    import re
-    if hasattr(entry, 'summary'):
-        img_match = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', entry.summary)
-        if img_match:
-            return img_match.group(1)
-    
+
+    # Try the summary's first <img>, reusing the already-parsed tree
+    if summary_tree is not None:
+        img = summary_tree.css_first('img')
+        if img is not None and img.attributes.get('src'):
+            return img.attributes['src']
+
     # Default placeholder
     return "https://images.unsplash.com/photo-1578319439584-104c94d37305?w=800"
 
 
-def filter_by_commodity(articles, commodity):
-    """Filter articles by commodity keywords"""
-    keywords = COMMODITY_KEYWORDS.get(commodity, [])
-    filtered = []
-    
-    for article in articles:
-        text = (article["title"] + " " + article["summary"]).lower()
-        if any(kw.lower() in text for kw in keywords):
-            filtered.append(article)
-    
-    return filtered
+def bucket_articles(articles):
+    """Dispatch every article to its matching section buckets in one pass
 
+    Replaces the per-commodity and per-region filter passes - each
+    article's search text is visited once and appended to every bucket
+    whose pattern matches.
+    """
+    buckets = {commodity: [] for commodity in COMMODITY_KEYWORDS}
+    buckets.update({f"region_{region}": [] for region in REGION_KEYWORDS})
+    buckets["junior"] = []
 
-def filter_by_region(articles, region):
-    """Filter articles by region keywords"""
-    keywords = REGION_KEYWORDS.get(region, [])
-    filtered = []
-    
     for article in articles:
-        text = (article["title"] + " " + article["summary"]).lower()
-        if any(kw.lower() in text for kw in keywords):
-            filtered.append(article)
-    
-    return filtered
+        text = article["_search_text"]
+        for commodity, pattern in COMMODITY_PATTERNS.items():
+            if pattern.search(text):
+                buckets[commodity].append(article)
+        for region, pattern in REGION_PATTERNS.items():
+            if pattern.search(text):
+                buckets[f"region_{region}"].append(article)
+        if JUNIOR_PATTERN.search(text):
+            buckets["junior"].append(article)
 
+    return buckets
 
-def curate_top_articles(articles, count=5, category="general"):
+
+async def curate_top_articles(articles, count=5, category="general"):
     """Use AI to select the most important articles"""
     if not articles:
         return []
@@ -175,18 +348,19 @@ Prioritize:
 Articles:
 {article_list}
 
-Return ONLY a JSON array of the article numbers (1-indexed) you selected, e.g., [1, 5, 12, 18, 23]
+Return the article numbers (1-indexed) you selected, e.g., [1, 5, 12, 18, 23]
 Select exactly {count} articles."""
 
     try:
-        response = client.chat.completions.create(
+        response = await _chat_parse(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
-            max_tokens=100
+            max_tokens=100,
+            response_format=Selection
         )
-        
-        selected_indices = json.loads(response.choices[0].message.content)
+
+        selected_indices = response.choices[0].message.parsed.indices
         return [articles[i-1] for i in selected_indices if 0 < i <= len(articles)]
     except Exception as e:
         print(f"AI curation error: {e}")
@@ -194,7 +368,7 @@ Select exactly {count} articles."""
         return articles[:count]
 
 
-def generate_expert_bullets(article):
+async def generate_expert_bullets(article):
     """Generate 3 expert-level bullet points for an article"""
     prompt = f"""You are a senior mining industry analyst. Generate exactly 3 expert-level bullet points for this mining news article.
 
@@ -209,23 +383,18 @@ Requirements:
 - Reference specific companies, projects, or technical details
 - Provide context on why this matters to the industry
 
-Return as JSON array of 3 objects with "text" and "source" fields:
-[
-  {{"text": "First expert bullet point...", "source": "{article['source']}"}},
-  {{"text": "Second expert bullet point...", "source": "{article['source']}"}},
-  {{"text": "Third expert bullet point...", "source": "{article['source']}"}}
-]"""
+Return 3 bullet objects with "text" and "source" fields; source is "{article['source']}"."""
 
     try:
-        response = client.chat.completions.create(
+        response = await _chat_parse(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.5,
-            max_tokens=500
+            max_tokens=500,
+            response_format=BulletList
         )
-        
-        bullets = json.loads(response.choices[0].message.content)
-        return bullets
+
+        return [b.model_dump() for b in response.choices[0].message.parsed.items]
     except Exception as e:
         print(f"Bullet generation error: {e}")
         return [
@@ -235,7 +404,7 @@ Return as JSON array of 3 objects with "text" and "source" fields:
         ]
 
 
-def generate_article_summary(article):
+async def generate_article_summary(article):
     """Generate a concise summary for an article"""
     prompt = f"""Summarize this mining news article in 1-2 sentences for industry professionals:
 
@@ -245,7 +414,7 @@ Content: {article['summary']}
 Be specific and include key numbers or details. Max 150 characters."""
 
     try:
-        response = client.chat.completions.create(
+        response = await _chat_completion(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
@@ -256,135 +425,343 @@ Be specific and include key numbers or details. Max 150 characters."""
         return article['summary'][:150]
 
 
-def categorize_article(article):
-    """Determine the category of an article"""
-    text = (article['title'] + " " + article['summary']).lower()
-    
-    if any(word in text for word in ['drill', 'intercept', 'assay', 'metres', 'meters', 'grade']):
-        return "Drill Results"
-    elif any(word in text for word in ['acquire', 'merger', 'takeover', 'bid', 'deal', 'm&a']):
-        return "M&A"
-    elif any(word in text for word in ['price', 'spot', 'futures', 'trading', 'market']):
-        return "Markets"
-    elif any(word in text for word in ['production', 'output', 'guidance', 'quarterly']):
-        return "Production"
-    elif any(word in text for word in ['policy', 'regulation', 'government', 'permit', 'approval']):
-        return "Policy"
-    elif any(word in text for word in ['exploration', 'discovery', 'target', 'prospective']):
-        return "Exploration"
-    else:
-        return "Industry"
-
-
-def process_articles(articles):
-    """Process articles with AI-generated content"""
-    processed = []
-    
-    for article in articles:
+class Bullet(BaseModel):
+    text: str
+    source: str
+
+
+class BulletList(BaseModel):
+    items: list[Bullet]
+
+
+class Selection(BaseModel):
+    indices: list[int]
+
+
+class ArticlePayload(BaseModel):
+    summary: str
+    bullets: list[Bullet]
+    category: str
+
+
+def _payload_request(article):
+    """Build the chat request body for an article's combined payload call
+
+    Shared between the live path and the Batch API path so both produce
+    identical completions.
+    """
+    categories = ", ".join(cat for cat, _ in CATEGORY_KEYWORDS)
+    prompt = f"""You are a senior mining industry analyst. Analyze this mining news article.
+
+Title: {article['title']}
+Source: {article['source']}
+Content: {article['summary']}
+
+Return a JSON object with exactly these fields:
+- "summary": a 1-2 sentence summary for industry professionals, specific with key numbers, max 150 characters
+- "bullets": an array of exactly 3 objects with "text" and "source" fields; each text is 2-3 sentences of expert-level analysis with specific numbers, companies and context, and source is "{article['source']}"
+- "category": one of: {categories}, Industry"""
+
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.5,
+        "max_tokens": 700,
+        "response_format": {"type": "json_object"}
+    }
+
+
+async def generate_article_payload(article):
+    """Generate summary, bullets and category in a single chat call
+
+    One round-trip instead of one per field, and title+summary are sent
+    as input tokens once. Returns None when the response doesn't match
+    the schema so the caller can fall back to the separate calls.
+    """
+    try:
+        response = await _chat_completion(**_payload_request(article))
+        return ArticlePayload.model_validate_json(response.choices[0].message.content)
+    except Exception as e:
+        print(f"Payload generation error: {e}")
+        return None
+
+
+async def batch_generate_payloads(articles):
+    """Run the combined payload calls through the OpenAI Batch API
+
+    Submits one batch for all articles (custom_id = stable article ID)
+    and polls until it completes or BATCH_DEADLINE_SECONDS passes.
+    Returns {link: ArticlePayload}; callers fall back to live calls for
+    any article missing from the result.
+    """
+    if not articles:
+        return {}
+
+    links_by_id = {str(article_id(a['link'])): a['link'] for a in articles}
+
+    try:
+        lines = "\n".join(json.dumps({
+            "custom_id": str(article_id(a['link'])),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _payload_request(a)
+        }) for a in articles)
+
+        batch_file = await client.files.create(
+            file=("article_payloads.jsonl", lines.encode('utf-8')),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} with {len(articles)} articles")
+
+        deadline = time.monotonic() + BATCH_DEADLINE_SECONDS
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() > deadline:
+                # Cancel so the abandoned batch stops billing tokens for
+                # output the live fallback is about to regenerate
+                print(f"Batch {batch.id} still {batch.status} at deadline, cancelling and falling back to live calls")
+                await client.batches.cancel(batch.id)
+                return {}
+            await asyncio.sleep(BATCH_POLL_SECONDS)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            print(f"Batch {batch.id} finished with status {batch.status}")
+            return {}
+
+        output = await client.files.content(batch.output_file_id)
+    except Exception as e:
+        print(f"Batch processing error: {e}")
+        return {}
+
+    payloads = {}
+    for line in output.text.splitlines():
         try:
-            processed_article = {
-                "id": hash(article['link']) % 10**9,
-                "headline": article['title'],
-                "link": article['link'],
-                "source": article['source'],
-                "sourceCount": 1,
-                "image": article['image'],
-                "published": article['published'],
-                "category": categorize_article(article),
-                "summary": generate_article_summary(article),
-                "bullets": generate_expert_bullets(article)
-            }
-            processed.append(processed_article)
-            print(f"Processed: {article['title'][:50]}...")
+            result = orjson.loads(line)
+            link = links_by_id.get(result.get("custom_id"))
+            body = result["response"]["body"]
+            if link and result["response"]["status_code"] == 200:
+                content = body["choices"][0]["message"]["content"]
+                payloads[link] = ArticlePayload.model_validate_json(content)
         except Exception as e:
-            print(f"Error processing article: {e}")
-    
-    return processed
+            print(f"Batch result parse error: {e}")
+
+    print(f"Batch returned {len(payloads)}/{len(articles)} payloads")
+    return payloads
+
+
+def categorize_article(article):
+    """Determine the category of an article"""
+    text = article["_search_text"]
+
+    for category, pattern in CATEGORY_PATTERNS:
+        if pattern.search(text):
+            return category
+    return "Industry"
+
+
+def article_id(link):
+    """Stable 48-bit article ID derived from the link
+
+    Built-in hash() is seeded per interpreter run, so IDs would differ
+    between Actions runs and the same article would get duplicate docs.
+    48 bits keeps the ID inside Firestore's signed int64 range and
+    JavaScript's exact-integer range while staying collision-free at
+    this article volume.
+    """
+    return int.from_bytes(hashlib.blake2b(link.encode('utf-8'), digest_size=6).digest(), 'big')
+
+
+def load_processed_cache(db, articles):
+    """Batch-fetch previously generated AI content for these articles
+
+    Feeds overlap heavily day to day; one get_all round-trip here saves
+    re-paying for summaries and bullets we already generated.
+    """
+    if db is None or not articles:
+        return {}
+
+    try:
+        refs = [
+            db.collection("processed_articles").document(str(article_id(a['link'])))
+            for a in articles
+        ]
+        cached = {}
+        for snapshot in db.get_all(refs):
+            if snapshot.exists:
+                data = snapshot.to_dict()
+                cached[data.get("link")] = data
+        return cached
+    except Exception as e:
+        print(f"Processed cache load error: {e}")
+        return {}
 
 
-def save_to_firestore(db, collection, data, doc_id=None):
-    """Save data to Firestore"""
+async def _process_one(article, cached=None, db=None, writer=None, payload=None):
+    """Process a single article, reusing cached AI content when available"""
     try:
-        if doc_id:
-            db.collection(collection).document(doc_id).set(data)
+        if cached:
+            category = cached.get("category", categorize_article(article))
+            summary = cached.get("summary", "")
+            bullets = cached.get("bullets", [])
+            print(f"Cached: {article['title'][:50]}...")
         else:
-            db.collection(collection).add(data)
-        print(f"Saved to {collection}/{doc_id or 'auto'}")
+            if payload is None:
+                payload = await generate_article_payload(article)
+            if payload is not None:
+                summary = payload.summary
+                bullets = [b.model_dump() for b in payload.bullets]
+                category = payload.category
+            else:
+                # Schema failure - fall back to the separate calls
+                summary, bullets = await asyncio.gather(
+                    generate_article_summary(article),
+                    generate_expert_bullets(article)
+                )
+                category = categorize_article(article)
+            if writer is not None:
+                writer.set(db.collection("processed_articles").document(str(article_id(article['link']))), {
+                    "headline": article['title'],
+                    "link": article['link'],
+                    "category": category,
+                    "summary": summary,
+                    "bullets": bullets
+                })
+            print(f"Processed: {article['title'][:50]}...")
+
+        return {
+            "id": article_id(article['link']),
+            "headline": article['title'],
+            "link": article['link'],
+            "source": article['source'],
+            "sourceCount": 1,
+            "image": article['image'],
+            "published": article['published'],
+            "category": category,
+            "summary": summary,
+            "bullets": bullets
+        }
+    except Exception as e:
+        print(f"Error processing article: {e}")
+        return None
+
+
+async def process_articles(db, articles, payloads=None, cached=None):
+    """Process articles with AI-generated content
+
+    payloads maps link -> ArticlePayload pre-generated via the Batch API;
+    anything not covered falls through to live calls. cached lets a
+    caller that already loaded the processed cache pass it in.
+    """
+    if cached is None:
+        cached = load_processed_cache(db, articles)
+    payloads = payloads or {}
+
+    # Collect per-article cache write-backs through a bulk writer so they
+    # go out as parallel batched commits instead of one RPC per article
+    writer = db.bulk_writer() if db is not None else None
+    results = await asyncio.gather(*[
+        _process_one(a, cached.get(a['link']), db, writer, payloads.get(a['link']))
+        for a in articles
+    ])
+    if writer is not None:
+        writer.close()
+
+    return [r for r in results if r is not None]
+
+
+def save_to_firestore(db, writes):
+    """Commit a list of (doc_ref, data) writes as one batch"""
+    try:
+        batch = db.batch()
+        for doc_ref, data in writes:
+            batch.set(doc_ref, data)
+        batch.commit()
+        print(f"Saved {len(writes)} documents")
     except Exception as e:
         print(f"Firestore save error: {e}")
 
 
-def main():
+async def main():
     """Main execution function"""
     print(f"Starting Chole News Fetcher at {datetime.now().isoformat()}")
-    
+
     # Initialize
     db = init_firebase()
-    
+
     # Fetch all articles
     print("Fetching RSS feeds...")
-    all_articles = fetch_all_feeds()
+    all_articles = fetch_all_feeds(db)
     print(f"Fetched {len(all_articles)} articles")
-    
+
     # Get today's date for document ID
     today = datetime.now().strftime("%Y-%m-%d")
-    
-    # Process "Today" - top 5 overall
-    print("\nProcessing Today's Top News...")
-    today_articles = curate_top_articles(all_articles, count=5, category="mining industry today")
-    today_processed = process_articles(today_articles)
-    
-    # Process each commodity
-    commodity_news = {}
+
+    # Build the article list for each section with one pass over the feed
+    buckets = bucket_articles(all_articles)
+
+    sections = {"today": ("mining industry today", all_articles)}
     for commodity in COMMODITY_KEYWORDS.keys():
-        print(f"\nProcessing {commodity} news...")
-        filtered = filter_by_commodity(all_articles, commodity)
-        if filtered:
-            curated = curate_top_articles(filtered, count=5, category=f"{commodity} mining")
-            commodity_news[commodity] = process_articles(curated)
-        else:
-            commodity_news[commodity] = []
-    
-    # Process each region
-    region_news = {}
+        sections[commodity] = (f"{commodity} mining", buckets[commodity])
     for region in REGION_KEYWORDS.keys():
-        print(f"\nProcessing {region} news...")
-        filtered = filter_by_region(all_articles, region)
-        if filtered:
-            curated = curate_top_articles(filtered, count=5, category=f"{region} mining")
-            region_news[f"region_{region}"] = process_articles(curated)
-        else:
-            region_news[f"region_{region}"] = []
-    
-    # Process Junior Mining news
-    print("\nProcessing Junior Mining news...")
-    junior_keywords = ["junior", "explorer", "tsx-v", "tsxv", "cse", "asx", "small cap", "drill result"]
-    junior_articles = [a for a in all_articles if any(kw in (a['title'] + a['summary']).lower() for kw in junior_keywords)]
-    junior_curated = curate_top_articles(junior_articles, count=5, category="junior mining exploration")
-    junior_processed = process_articles(junior_curated)
-    
+        sections[f"region_{region}"] = (f"{region} mining", buckets[f"region_{region}"])
+    sections["junior"] = ("junior mining exploration", buckets["junior"])
+
+    # Curate all sections concurrently, then process all curated articles
+    # concurrently - the OpenAI calls are independent I/O
+    print("\nCurating sections...")
+    curated_lists = await asyncio.gather(*[
+        curate_top_articles(articles, count=5, category=category)
+        for category, articles in sections.values()
+    ])
+
+    # Sections overlap heavily, so dedupe by link and run the LLM
+    # pipeline once per unique article instead of once per appearance
+    unique_articles = list({a['link']: a for curated in curated_lists for a in curated}.values())
+
+    # In batch mode, pre-generate payloads for every uncached curated
+    # article through the Batch API in one submission
+    batch_payloads = {}
+    already_cached = None
+    if USE_OPENAI_BATCH:
+        print("\nSubmitting OpenAI batch...")
+        already_cached = load_processed_cache(db, unique_articles)
+        batch_payloads = await batch_generate_payloads(
+            [a for a in unique_articles if a['link'] not in already_cached]
+        )
+
+    print(f"\nProcessing {len(unique_articles)} unique curated articles...")
+    processed = await process_articles(db, unique_articles, batch_payloads, already_cached)
+    processed_by_link = {p['link']: p for p in processed}
+
+    section_news = {
+        section: [processed_by_link[a['link']] for a in curated if a['link'] in processed_by_link]
+        for section, curated in zip(sections.keys(), curated_lists)
+    }
+
     # Save to Firestore
     print("\nSaving to Firestore...")
-    
+
     # Save daily news
     daily_data = {
         "date": today,
         "updatedAt": firestore.SERVER_TIMESTAMP,
-        "today": today_processed,
-        "junior": junior_processed,
-        **commodity_news,
-        **region_news
+        **section_news
     }
-    save_to_firestore(db, "daily_news", daily_data, today)
-    
-    # Also save as "latest" for easy access
-    save_to_firestore(db, "daily_news", daily_data, "latest")
-    
+    # Save the dated doc and "latest" in a single batched commit
+    save_to_firestore(db, [
+        (db.collection("daily_news").document(today), daily_data),
+        (db.collection("daily_news").document("latest"), daily_data)
+    ])
+
     print(f"\nCompleted at {datetime.now().isoformat()}")
-    print(f"Processed: {len(today_processed)} today, {len(junior_processed)} junior")
-    for commodity, articles in commodity_news.items():
-        print(f"  {commodity}: {len(articles)} articles")
+    for section, articles in section_news.items():
+        print(f"  {section}: {len(articles)} articles")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -5,8 +5,9 @@ Generates script with GPT-4, converts to audio with OpenAI TTS
 Runs daily at 6 AM ET via GitHub Actions
 """
 
+import io
 import os
-import json
+import orjson
 from datetime import datetime
 from openai import OpenAI
 import firebase_admin
@@ -15,7 +16,7 @@ from firebase_admin import credentials, firestore, storage
 # Initialize Firebase
 def init_firebase():
     if not firebase_admin._apps:
-        service_account = json.loads(os.environ.get('FIREBASE_SERVICE_ACCOUNT', '{}'))
+        service_account = orjson.loads(os.environ.get('FIREBASE_SERVICE_ACCOUNT', '{}'))
         if service_account:
             cred = credentials.Certificate(service_account)
         else:
@@ -88,8 +89,12 @@ Begin the script directly with the greeting, no titles or headers."""
         return None
 
 
-def generate_audio(script, output_path):
-    """Convert script to audio using OpenAI TTS"""
+def generate_audio(script):
+    """Convert script to audio using OpenAI TTS
+
+    Returns the MP3 as an in-memory buffer - no /tmp round-trip before
+    the Storage upload.
+    """
     try:
         response = client.audio.speech.create(
             model="tts-1-hd",
@@ -97,26 +102,23 @@ def generate_audio(script, output_path):
             input=script,
             speed=1.0
         )
-        
-        # Save to file
-        response.stream_to_file(output_path)
-        print(f"Audio saved to {output_path}")
-        return True
+        print("Audio generated")
+        return io.BytesIO(response.content)
     except Exception as e:
         print(f"TTS error: {e}")
-        return False
+        return None
 
 
-def upload_to_storage(local_path, remote_path):
-    """Upload file to Firebase Storage"""
+def upload_to_storage(audio_buffer, remote_path):
+    """Upload an audio buffer to Firebase Storage"""
     try:
         bucket = storage.bucket()
         blob = bucket.blob(remote_path)
-        blob.upload_from_filename(local_path)
-        
+        blob.upload_from_file(audio_buffer, content_type="audio/mpeg")
+
         # Make publicly accessible
         blob.make_public()
-        
+
         print(f"Uploaded to {blob.public_url}")
         return blob.public_url
     except Exception as e:
@@ -176,14 +178,14 @@ def main():
     
     # Generate audio
     print("Generating audio...")
-    local_audio_path = f"/tmp/podcast_{today}.mp3"
-    
-    if generate_audio(script, local_audio_path):
+    audio_buffer = generate_audio(script)
+
+    if audio_buffer is not None:
         # Upload to Firebase Storage
         print("Uploading to Firebase Storage...")
         remote_path = f"podcasts/{today}/briefing.mp3"
-        audio_url = upload_to_storage(local_audio_path, remote_path)
-        
+        audio_url = upload_to_storage(audio_buffer, remote_path)
+
         if audio_url:
             # Save metadata
             save_podcast_metadata(db, today, script, audio_url)
@@ -193,11 +195,7 @@ def main():
             print("Failed to upload audio")
     else:
         print("Failed to generate audio")
-    
-    # Cleanup
-    if os.path.exists(local_audio_path):
-        os.remove(local_audio_path)
-    
+
     print(f"\nCompleted at {datetime.now().isoformat()}")
 
 
@@ -5,7 +5,8 @@ Runs daily at 6 AM ET via GitHub Actions
 """
 
 import os
-import json
+import orjson
+from collections import namedtuple
 from datetime import datetime
 import yfinance as yf
 import firebase_admin
@@ -14,7 +15,7 @@ from firebase_admin import credentials, firestore
 # Initialize Firebase
 def init_firebase():
     if not firebase_admin._apps:
-        service_account = json.loads(os.environ.get('FIREBASE_SERVICE_ACCOUNT', '{}'))
+        service_account = orjson.loads(os.environ.get('FIREBASE_SERVICE_ACCOUNT', '{}'))
         if service_account:
             cred = credentials.Certificate(service_account)
         else:
@@ -24,59 +25,96 @@ def init_firebase():
 
 
 # Commodity tickers (Yahoo Finance symbols)
+Commodity = namedtuple("Commodity", "symbol name display unit")
+
 COMMODITIES = [
-    {"symbol": "GC=F", "name": "Gold", "display": "Gold", "unit": "/oz"},
-    {"symbol": "SI=F", "name": "Silver", "display": "Silver", "unit": "/oz"},
-    {"symbol": "HG=F", "name": "Copper", "display": "Copper", "unit": "/lb"},
-    {"symbol": "UXA=F", "name": "Uranium", "display": "Uranium", "unit": "/lb"},  # May need alternative source
-    {"symbol": "PL=F", "name": "Platinum", "display": "Platinum", "unit": "/oz"},
-    {"symbol": "PA=F", "name": "Palladium", "display": "Palladium", "unit": "/oz"},
-    {"symbol": "ALI=F", "name": "Aluminum", "display": "Aluminum", "unit": "/lb"},
-    {"symbol": "NI=F", "name": "Nickel", "display": "Nickel", "unit": "/lb"},
+    Commodity("GC=F", "Gold", "Gold", "/oz"),
+    Commodity("SI=F", "Silver", "Silver", "/oz"),
+    Commodity("HG=F", "Copper", "Copper", "/lb"),
+    Commodity("UXA=F", "Uranium", "Uranium", "/lb"),  # May need alternative source
+    Commodity("PL=F", "Platinum", "Platinum", "/oz"),
+    Commodity("PA=F", "Palladium", "Palladium", "/oz"),
+    Commodity("ALI=F", "Aluminum", "Aluminum", "/lb"),
+    Commodity("NI=F", "Nickel", "Nickel", "/lb"),
 ]
 
 # Additional mining ETFs for reference
+ETF = namedtuple("ETF", "symbol name display")
+
 ETFS = [
-    {"symbol": "GDX", "name": "VanEck Gold Miners ETF", "display": "GDX"},
-    {"symbol": "GDXJ", "name": "VanEck Junior Gold Miners ETF", "display": "GDXJ"},
-    {"symbol": "SIL", "name": "Global X Silver Miners ETF", "display": "SIL"},
-    {"symbol": "COPX", "name": "Global X Copper Miners ETF", "display": "COPX"},
-    {"symbol": "URA", "name": "Global X Uranium ETF", "display": "URA"},
-    {"symbol": "LIT", "name": "Global X Lithium ETF", "display": "LIT"},
+    ETF("GDX", "VanEck Gold Miners ETF", "GDX"),
+    ETF("GDXJ", "VanEck Junior Gold Miners ETF", "GDXJ"),
+    ETF("SIL", "Global X Silver Miners ETF", "SIL"),
+    ETF("COPX", "Global X Copper Miners ETF", "COPX"),
+    ETF("URA", "Global X Uranium ETF", "URA"),
+    ETF("LIT", "Global X Lithium ETF", "LIT"),
 ]
 
 
+def _price_data(closes):
+    """Build price/change data from a series of closing prices"""
+    if len(closes) < 1:
+        return None
+
+    current_price = closes.iloc[-1]
+
+    # Calculate change
+    if len(closes) >= 2:
+        prev_price = closes.iloc[-2]
+        change = current_price - prev_price
+        change_pct = (change / prev_price) * 100
+    else:
+        change = 0
+        change_pct = 0
+
+    return {
+        "price": round(current_price, 2),
+        "change": round(change, 2),
+        "changePct": round(change_pct, 2),
+        "up": change_pct >= 0
+    }
+
+
 def fetch_price(symbol):
-    """Fetch current price and change for a symbol"""
+    """Fetch current price and change for a single symbol"""
     try:
         ticker = yf.Ticker(symbol)
         hist = ticker.history(period="2d")
-        
-        if len(hist) < 1:
-            return None
-        
-        current_price = hist['Close'].iloc[-1]
-        
-        # Calculate change
-        if len(hist) >= 2:
-            prev_price = hist['Close'].iloc[-2]
-            change = current_price - prev_price
-            change_pct = (change / prev_price) * 100
-        else:
-            change = 0
-            change_pct = 0
-        
-        return {
-            "price": round(current_price, 2),
-            "change": round(change, 2),
-            "changePct": round(change_pct, 2),
-            "up": change_pct >= 0
-        }
+        return _price_data(hist['Close'])
     except Exception as e:
         print(f"Error fetching {symbol}: {e}")
         return None
 
 
+def fetch_batch_prices(symbols):
+    """Fetch price data for all symbols in one batched download
+
+    Returns a dict of symbol -> price data (None where the fetch failed),
+    so the formatting loops below never touch the network.
+    """
+    try:
+        df = yf.download(
+            tickers=" ".join(symbols),
+            period="2d",
+            group_by="ticker",
+            threads=True,
+            progress=False
+        )
+    except Exception as e:
+        print(f"Error fetching batch prices: {e}")
+        return {symbol: None for symbol in symbols}
+
+    price_data = {}
+    for symbol in symbols:
+        try:
+            price_data[symbol] = _price_data(df[symbol]['Close'].dropna())
+        except Exception as e:
+            print(f"Error fetching {symbol}: {e}")
+            price_data[symbol] = None
+
+    return price_data
+
+
 def format_price(price, unit=""):
     """Format price for display"""
     if price >= 1000:
@@ -95,19 +133,18 @@ def format_change(change_pct):
     return f"{sign}{change_pct:.1f}%"
 
 
-def fetch_all_prices():
-    """Fetch all commodity prices"""
+def fetch_all_prices(price_data):
+    """Format all commodity prices from batch-fetched data"""
     prices = []
-    
+
     for commodity in COMMODITIES:
-        print(f"Fetching {commodity['name']}...")
-        data = fetch_price(commodity['symbol'])
-        
+        data = price_data.get(commodity.symbol)
+
         if data:
             prices.append({
-                "symbol": commodity['display'],
-                "name": commodity['name'],
-                "value": format_price(data['price'], commodity['unit']),
+                "symbol": commodity.display,
+                "name": commodity.name,
+                "value": format_price(data['price'], commodity.unit),
                 "rawPrice": data['price'],
                 "change": format_change(data['changePct']),
                 "changePct": data['changePct'],
@@ -116,8 +153,8 @@ def fetch_all_prices():
         else:
             # Placeholder if fetch fails
             prices.append({
-                "symbol": commodity['display'],
-                "name": commodity['name'],
+                "symbol": commodity.display,
+                "name": commodity.name,
                 "value": "N/A",
                 "rawPrice": 0,
                 "change": "0.0%",
@@ -128,18 +165,17 @@ def fetch_all_prices():
     return prices
 
 
-def fetch_etf_prices():
-    """Fetch mining ETF prices"""
+def fetch_etf_prices(price_data):
+    """Format mining ETF prices from batch-fetched data"""
     etf_prices = []
-    
+
     for etf in ETFS:
-        print(f"Fetching {etf['name']}...")
-        data = fetch_price(etf['symbol'])
-        
+        data = price_data.get(etf.symbol)
+
         if data:
             etf_prices.append({
-                "symbol": etf['display'],
-                "name": etf['name'],
+                "symbol": etf.display,
+                "name": etf.name,
                 "value": f"${data['price']:.2f}",
                 "rawPrice": data['price'],
                 "change": format_change(data['changePct']),
@@ -182,10 +218,11 @@ def save_to_firestore(db, prices, etf_prices):
     }
     
     try:
-        # Save by date
-        db.collection("commodity_prices").document(today).set(data)
-        # Save as latest
-        db.collection("commodity_prices").document("latest").set(data)
+        # Save the dated doc and "latest" in a single batched commit
+        batch = db.batch()
+        batch.set(db.collection("commodity_prices").document(today), data)
+        batch.set(db.collection("commodity_prices").document("latest"), data)
+        batch.commit()
         print(f"Prices saved for {today}")
     except Exception as e:
         print(f"Firestore save error: {e}")
@@ -198,13 +235,14 @@ def main():
     # Initialize
     db = init_firebase()
     
-    # Fetch commodity prices
-    print("\nFetching commodity prices...")
-    prices = fetch_all_prices()
-    
-    # Fetch ETF prices
-    print("\nFetching ETF prices...")
-    etf_prices = fetch_etf_prices()
+    # Fetch everything in one batched download instead of one
+    # network round-trip per symbol
+    print("\nFetching prices...")
+    symbols = [c.symbol for c in COMMODITIES] + [e.symbol for e in ETFS]
+    price_data = fetch_batch_prices(symbols)
+
+    prices = fetch_all_prices(price_data)
+    etf_prices = fetch_etf_prices(price_data)
     
     # Print summary
     print("\n--- COMMODITY PRICES ---")